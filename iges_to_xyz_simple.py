@@ -9,12 +9,62 @@ import pyiges
 import pyvista as pv
 import os
 from tqdm import tqdm
+try:
+    from scipy.spatial import cKDTree
+except ImportError:
+    cKDTree = None
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        return lambda function: function
+
+
+# Fast-math without the 'nnan'/'ninf' flags, the searches compare against an infinite initial minimum
+@njit(parallel=False, fastmath={'nsz', 'arcp', 'contract', 'afn', 'reassoc'})
+def _order_indices(pts, origin):
+    """Order points by brute-force nearest neighbor search, used when SciPy is not available. Returns the indices."""
+    n = pts.shape[0]
+    visited = np.zeros(n, np.bool_)
+    order = np.empty(n, np.int64)
+
+    # Find point closest to origin, using squared distances
+    start = 0
+    min_dist_sq = np.inf
+    for j in range(n):
+        dist_sq = (pts[j, 0] - origin[0])**2 + (pts[j, 1] - origin[1])**2 + (pts[j, 2] - origin[2])**2
+        if dist_sq < min_dist_sq:
+            min_dist_sq = dist_sq
+            start = j
+    order[0] = start
+    visited[start] = True
+
+    for i in range(1, n):
+        # Find nearest unvisited point
+        current = order[i - 1]
+        nearest = -1
+        min_dist_sq = np.inf
+        for j in range(n):
+            if visited[j]:
+                continue
+            dist_sq = (pts[j, 0] - pts[current, 0])**2 + (pts[j, 1] - pts[current, 1])**2 + (pts[j, 2] - pts[current, 2])**2
+            if dist_sq < min_dist_sq:
+                min_dist_sq = dist_sq
+                nearest = j
+        order[i] = nearest
+        visited[nearest] = True
+
+    return order
+
+
 class IgesToXyz:
     def __init__(self, iges_filename,spacing_mm=0.5):
         self.iges_filename = iges_filename
         self.spacing_mm = spacing_mm
         self.output_file = "xyz_coordinates.txt"
         self.origin = np.array([0, 0, 0])
+        self._vtk_cache_file = None  # (filename, modification time) the cached points were extracted from
+        self._vtk_cache: dict[int, np.ndarray | None] = {}  # Extracted points per entity sequence number
 
 
     def convert_iges_to_xyz(self):
@@ -34,40 +84,48 @@ class IgesToXyz:
         # Load the IGES file
         iges = pyiges.read(self.iges_filename)
         print(f"Successfully loaded IGES file with {len(iges)} entities")
+
+        # Points extracted by an earlier conversion are only reused while the file is unchanged on disk
+        cache_file = (self.iges_filename, os.stat(self.iges_filename).st_mtime_ns)
+        if cache_file != self._vtk_cache_file:
+            self._vtk_cache_file, self._vtk_cache = cache_file, {}
         
         # Convert to VTK format for point extraction
-        all_points = []
+        chunks: list[np.ndarray] = []
         for entity in tqdm(iges, desc="Converting entities to vtk"):
-            try:
-                vtk_obj = entity.to_vtk()
-                if vtk_obj is not None:
-                    # Convert to PyVista object
-                    pv_obj = pv.wrap(vtk_obj)
-                    
-                    # Extract points based on object type
-                    if hasattr(pv_obj, 'points') and pv_obj.points is not None:
-                        points = pv_obj.points
-                        all_points.extend(points)
-            except Exception as e:
-                continue  # Skip problematic entities
+            points = self._extract_entity_points(entity)
+            if points is not None and len(points) > 0:
+                chunks.append(points)
+        all_points = np.concatenate(chunks, axis=0) if chunks else np.empty((0, 3))
         
         print(f"Extracted {len(all_points)} points from IGES")
         
-        if not all_points:
+        if len(all_points) == 0:
             raise ValueError("No valid points found in IGES file")
         
         # Remove duplicate points (tolerance for floating point comparison)
-        unique_points = []
+        # Kept points are bucketed in a grid with the tolerance as cell size, so any point within the tolerance of a
+        # new point lies in the same or one of the 26 neighboring cells. Only those are compared, preserving the
+        # original order and tolerance.
         tolerance = 1e-6  # 1 micrometer tolerance
-        
-        for point in all_points:
+        tolerance_sq = tolerance*tolerance
+        neighbor_offsets = [(dx, dy, dz) for dx in (-1, 0, 1) for dy in (-1, 0, 1) for dz in (-1, 0, 1)]
+        grid: dict[tuple[int, int, int], list[tuple[float, float, float]]] = {}
+        unique_indices = []
+        keys = np.floor(all_points / tolerance).astype(np.int64).tolist()
+        for i, ((kx, ky, kz), (x, y, z)) in enumerate(zip(keys, all_points.tolist())):
             is_duplicate = False
-            for existing_point in unique_points:
-                if np.linalg.norm(np.array(point) - np.array(existing_point)) < tolerance:
-                    is_duplicate = True
+            for dx, dy, dz in neighbor_offsets:
+                for ex, ey, ez in grid.get((kx + dx, ky + dy, kz + dz), ()):
+                    if (x - ex)**2 + (y - ey)**2 + (z - ez)**2 < tolerance_sq:
+                        is_duplicate = True
+                        break
+                if is_duplicate:
                     break
             if not is_duplicate:
-                unique_points.append(point)
+                grid.setdefault((kx, ky, kz), []).append((x, y, z))
+                unique_indices.append(i)
+        unique_points = all_points[unique_indices]
         
         print(f"After removing duplicates: {len(unique_points)} points")
         
@@ -78,50 +136,91 @@ class IgesToXyz:
         arc_length_points = self.extract_arc_length_points(ordered_points, self.spacing_mm)
 
         # Write XYZ coordinates file
-        with open(self.output_file, 'w') as f:
-            f.write("X\tY\tZ\n")  # Header for Excel
-            for coord in arc_length_points:
-                f.write(f"{coord[0]:.6f}\t{coord[1]:.6f}\t{coord[2]:.6f}\n")
+        np.savetxt(self.output_file, np.asarray(arc_length_points, dtype=np.float64), fmt='%.6f', delimiter='\t',
+                   header='X\tY\tZ', comments='')  # Header for Excel
         
         print(f"Successfully wrote {len(arc_length_points)} coordinates to: {self.output_file}")
         return arc_length_points
 
+    def _extract_entity_points(self, entity):
+        """Extract the points of a single IGES entity, or None if the entity cannot be converted"""
+        # Reuse the points of entities already extracted from this file
+        sequence_number = getattr(entity, 'sequence_number', None)
+        if sequence_number in self._vtk_cache:
+            return self._vtk_cache[sequence_number]
+        points = self._entity_to_points(entity)
+        if sequence_number is not None:
+            self._vtk_cache[sequence_number] = points
+        return points
+
+    def _entity_to_points(self, entity):
+        """Convert a single IGES entity through VTK to its points, or None if the entity cannot be converted"""
+        try:
+            vtk_obj = entity.to_vtk()
+            if vtk_obj is None:
+                return None
+            # Convert to PyVista object
+            pv_obj = pv.wrap(vtk_obj)
+            
+            # Extract points based on object type
+            if not hasattr(pv_obj, 'points') or pv_obj.points is None:
+                return None
+            return np.asarray(pv_obj.points, dtype=np.float64)
+        except Exception as e:
+            return None  # Skip problematic entities
+
     def order_points_from_origin(self,points):
         """Order points starting from the one closest to origin"""
-        if not points:
-            return []
+        points_array = np.asarray(points, dtype=np.float64)
+        if len(points_array) == 0:
+            return points_array
+        if cKDTree is None:
+            order = _order_indices(points_array, self.origin.astype(np.float64))
+            print(f"Starting from point closest to origin: {points_array[order[0]]}")
+            return points_array[order]
         
-        # Find point closest to origin
-        distances = [np.linalg.norm(np.array(point) - self.origin) for point in points]
-        start_idx = np.argmin(distances)
-        start_point = points[start_idx]
+        # Find point closest to origin, squared distances suffice for the argmin
+        offsets = points_array - self.origin
+        start_idx = int(np.einsum('ij,ij->i', offsets, offsets).argmin())
+        start_point = points_array[start_idx]
         
         print(f"Starting from point closest to origin: {start_point}")
         
         # Simple ordering by building a path through nearest neighbors
-        ordered = [start_point]
-        remaining = [p for i, p in enumerate(points) if i != start_idx]
+        # A KD-tree is built once and queried for the nearest neighbors of the current point. If all of them are
+        # visited already, more neighbors are queried until an unvisited point is found.
+        n_points = len(points_array)
+        tree = cKDTree(points_array)
+        visited = np.zeros(n_points, dtype=bool)
+        order = np.empty(n_points, dtype=np.intp)
         
-        current_point = start_point
-        while remaining:
-            # Find nearest remaining point
-            distances = [np.linalg.norm(np.array(p) - np.array(current_point)) for p in remaining]
-            nearest_idx = np.argmin(distances)
-            nearest_point = remaining.pop(nearest_idx)
-            ordered.append(nearest_point)
-            current_point = nearest_point
+        current_idx = int(start_idx)
+        visited[current_idx] = True
+        order[0] = current_idx
+        for i in range(1, n_points):
+            k = 16
+            while True:
+                # Find nearest unvisited point
+                _, neighbor_indices = tree.query(points_array[current_idx], k=min(k, n_points))
+                unvisited_indices = neighbor_indices[~visited[neighbor_indices]]
+                if len(unvisited_indices) > 0:
+                    break
+                k *= 4
+            current_idx = int(unvisited_indices[0])
+            visited[current_idx] = True
+            order[i] = current_idx
         
-        return ordered
+        return points_array[order]
 
     def extract_arc_length_points(self,points, spacing_mm):
         """Extract points along path with specified arc-length spacing"""
-        if len(points) < 2:
-            return points
+        points_array = np.asarray(points, dtype=np.float64)
+        if len(points_array) < 2:
+            return points_array
         
         print(f"Extracting points with {spacing_mm}mm arc-length spacing...")
         
         # Calculate cumulative distances
-        points_array = np.array(points)
         distances = np.sqrt(np.sum(np.diff(points_array, axis=0)**2, axis=1))
         cumulative_distances = np.concatenate([[0], np.cumsum(distances)])
         
@@ -134,24 +233,11 @@ class IgesToXyz:
         
         print(f"Generating {num_points} points with {spacing_mm}mm spacing")
         
-        # Interpolate points at target distances
-        interpolated_points = []
-        for target_dist in target_distances:
-            # Find the segment containing this distance
-            segment_idx = np.searchsorted(cumulative_distances, target_dist) - 1
-            segment_idx = max(0, min(segment_idx, len(points) - 2))
-            
-            # Interpolate within the segment
-            dist_in_segment = target_dist - cumulative_distances[segment_idx]
-            segment_length = cumulative_distances[segment_idx + 1] - cumulative_distances[segment_idx]
-            
-            if segment_length > 0:
-                t = dist_in_segment / segment_length
-                interpolated_point = (1 - t) * points_array[segment_idx] + t * points_array[segment_idx + 1]
-            else:
-                interpolated_point = points_array[segment_idx]
-            
-            interpolated_points.append(interpolated_point)
+        # Interpolate points at target distances, one coordinate at a time
+        xi = np.interp(target_distances, cumulative_distances, points_array[:, 0])
+        yi = np.interp(target_distances, cumulative_distances, points_array[:, 1])
+        zi = np.interp(target_distances, cumulative_distances, points_array[:, 2])
+        interpolated_points = np.column_stack([xi, yi, zi])
         
         # Verify spacing
         if len(interpolated_points) > 1:
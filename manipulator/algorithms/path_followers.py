@@ -21,12 +21,13 @@ class Telemetry:
     
     This ensures proper alignment for velocity tracking analysis.
     """
-    data: dict[str, list[Any]] = field(default_factory=dict)
+    data: dict[str, tuple[npt.NDArray, int]] = field(default_factory=dict)  # key: (buffer, number of samples)
     # t: list = field(default_factory=list)                        # seconds
     # positions_mm: list = field(default_factory=list)             # (3,)
     # next_velocity_ms: list = field(default_factory=list)         # (3,)
     # actual_velocities_ms: list = field(default_factory=list)     # (3,)
     enabled: bool = True                                         # Recording enable flag
+    initial_capacity: int = 1024                                 # Samples preallocated per key, doubled when full
 
     def start_recording(self):
         """Enable telemetry logging."""
@@ -43,15 +44,34 @@ class Telemetry:
         """
         if not self.enabled:
             return  # skip logging if disabled
-        if self.data.get(key) is None:
-            self.data.update({key: [value]})
-        else:
-            self.data[key].append(value)
+        try:
+            buffer, length = self.data[key]
+        except KeyError:
+            # First sample of this key, the buffer takes the shape of the sample.
+            buffer, length = np.empty((self.initial_capacity, *np.shape(value)), dtype=np.float64), 0
+        if length == len(buffer):
+            grown_buffer = np.empty((2*len(buffer), *buffer.shape[1:]), dtype=np.float64)
+            grown_buffer[:length] = buffer
+            buffer = grown_buffer
+        buffer[length] = value
+        self.data[key] = (buffer, length + 1)
+
+    def to_arrays(self, keys: tuple[str, ...] = ('t', 'positions', 'next_demand_velocity', 'actual_velocity')) -> tuple[npt.NDArray, ...]:
+        """
+        Recorded samples of the given keys, in the same order as the keys. Defaults to the keys recorded by
+        'Controller.follow_path'. The arrays are views of the recording buffers.
+        
+        """
+        arrays = []
+        for key in keys:
+            buffer, length = self.data[key]
+            arrays.append(buffer[:length])
+        return tuple(arrays)
 
     def export_to_csv(self, path: Path | str) -> None:
         df = pd.DataFrame()
-        for key, value in self.data.items():
-            value = np.asarray(value)
+        for key, (buffer, length) in self.data.items():
+            value = buffer[:length]
             if value.ndim == 1:
                 df[key] = value
             elif value.ndim == 2:
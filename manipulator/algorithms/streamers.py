@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from typing import Literal
 import math
 import time
+import numpy as np
 
 class Stream(ABC):
     
@@ -43,9 +44,9 @@ class Test_Stream(Stream):
         
         stop_streaming = False if elapsed_time < 1 else True
 
+        # sin(x - pi/2) = -cos(x), evaluated once for both drives.
         drive_1_pos = 0
-        drive_2_pos = self.amplitude*math.sin(elapsed_time*self.frequency - math.pi/2) + self.amplitude
-        drive_3_pos = self.amplitude*math.sin(elapsed_time*self.frequency - math.pi/2) + self.amplitude
+        drive_2_pos = drive_3_pos = self.amplitude*(1 - math.cos(elapsed_time*self.frequency))
 
         drive_1_vel = 0
         drive_2_vel = 0.1
@@ -68,6 +69,25 @@ class SpaceMouse(Stream):
     def cycle_time(self) -> float:
         return self._dt
 
+    # The limits are kept as per-axis arrays as well so all three axes are updated in one vectorized expression.
+    @property
+    def stroke(self) -> tuple[tuple[float, float], tuple[float, float], tuple[float, float]]:
+        return self._stroke
+
+    @stroke.setter
+    def stroke(self, stroke_mm: tuple[tuple[float, float], tuple[float, float], tuple[float, float]]) -> None:
+        self._stroke = stroke_mm
+        self._stroke_lo, self._stroke_hi = np.asarray(stroke_mm, dtype=float).T
+
+    @property
+    def vmax(self) -> tuple[float, float, float]:
+        return self._vmax_mm_s
+
+    @vmax.setter
+    def vmax(self, vmax_mm_s: tuple[float, float, float]) -> None:
+        self._vmax_mm_s = vmax_mm_s
+        self._vmax = np.asarray(vmax_mm_s, dtype=float)
+
     def __init__(self, *, 
                  rate_hz: float = 200, 
                  stroke_mm: tuple[tuple[float, float], tuple[float, float], tuple[float, float]] = ((0,50), (0,50), (0,25)), 
@@ -99,17 +119,9 @@ class SpaceMouse(Stream):
         # Keep a reference to the module so other methods can call it
         self._spm = spm
 
-        self.pos = [(lo + hi)/2.0 for lo, hi in stroke_mm]
-        self.vel = [0.0, 0.0, 0.0]
+        self.pos = (self._stroke_lo + self._stroke_hi)/2.0
+        self.vel = np.zeros(3)
 
-
-    def _dz(self, v: float) -> float: 
-        return 0.0 if abs(v) < self.deadzone else v
-    
-    def _clamp(self, x, lo, hi) -> float:
-         return lo if x < lo else (hi if x > hi else x)
-    
-        
     def _is_deadman_pressed(self, buttons):
         # If deadman_button is None, bypass the deadman check
         if self.deadman_button is None:
@@ -138,23 +150,15 @@ class SpaceMouse(Stream):
         # Use the lazily imported module stored on the instance
         state = getattr(self, '_spm').read()
         if state is None or not self._is_deadman_pressed(getattr(state, 'buttons', [])):
-            return False, [(self.pos[i], 0.0, 0.0) for i in range(3)]
-
-        raw_axes = (float(state.x), float(state.y), float(state.z))
-        coords: list[tuple[float, float, float]]=[]
-
+            return False, [(p, 0.0, 0.0) for p in self.pos.tolist()]
 
-        for i, raw in enumerate(raw_axes):
-            v = self._dz(raw) * self.gain
-            v = self._clamp(v, -self.vmax[i], self.vmax[i])
-            lo, hi = self.stroke[i]
-            p = self._clamp(self.pos[i] + v*self._dt, lo, hi)   
-            self.pos[i] = p
-            self.vel[i] = v
+        raw_axes = np.array((state.x, state.y, state.z), dtype=float)
 
-            coords.append((p, v, 0.0))
+        v = raw_axes * (np.abs(raw_axes) >= self.deadzone) * self.gain
+        self.vel = np.clip(v, -self._vmax, self._vmax)
+        self.pos = np.clip(self.pos + self.vel*self._dt, self._stroke_lo, self._stroke_hi)
 
-        return False, coords
+        return False, list(zip(self.pos.tolist(), self.vel.tolist(), (0.0, 0.0, 0.0)))
     
     def close(self) -> None:
         try:
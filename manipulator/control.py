@@ -1,8 +1,9 @@
 from . import io
 from .hardware import Driver, DriveError, CommandParameters
-from concurrent.futures import Future
+from concurrent.futures import Future, wait, ALL_COMPLETED
+import asyncio
+import gc
 import time
-from typing import Any
 import numpy as np
 import numpy.typing as npt
 import logging
@@ -84,14 +85,34 @@ class Controller:
         self.futures: list[Future | None] = [None]*len(self.drivers)
         
     def _wait_for_response_on_all(self) -> None:
-        for future in self.futures:
+        # Waits for all drivers at once so no single slow driver delays the error handling of the others.
+        futures = [future for future in self.futures if future is not None]
+        wait(futures, return_when=ALL_COMPLETED)
+        for future in futures:
             try:
                 future.result()
             except DriveError:
                 continue
 
-    def _read_from_futures(self) -> list[Any]:
-        return [future.result() for future in self.futures]
+    async def wait_for_response_on_all_async(self) -> None:
+        """
+        Awaitable counterpart of '_wait_for_response_on_all' for use in an asyncio event loop. The futures of the drivers
+        are chained directly to the event loop instead of blocking an executor thread per future, since the drivers already
+        run the commands on their own threads.
+        """
+        results = await asyncio.gather(*(asyncio.wrap_future(future) for future in self.futures if future is not None),
+                                       return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(result, DriveError):
+                raise result
+
+    def _read_positions_and_velocities(self) -> tuple[npt.NDArray, npt.NDArray]:
+        # Fills the (position, velocity) results of all drivers directly into one array with a contiguous row per quantity.
+        # A new array is used on every call since the callers (e.g. the path followers) may keep references to the rows.
+        values = np.empty((2, len(self.futures)))
+        for i, future in enumerate(self.futures):
+            values[:, i] = future.result()
+        return values[0], values[1]
 
     def home(self, timeout: float = 30.0, overwrite_already_homed_check: bool = False) -> None:
         for i, driver in enumerate(self.drivers):
@@ -116,45 +137,57 @@ class Controller:
         
         self._wait_for_response_on_all()
         
-        # Runs the streaming loop.
-        next_cycle_time = time.time()
+        # Moves the objects alive at this point out of the garbage collected generations such that the collector has less
+        # to traverse while streaming. Garbage is collected first so it isn't frozen along with them.
+        gc.collect()
+        gc.freeze()
+
+        # Runs the streaming loop. The schedule uses the monotonic performance counter in nanoseconds.
+        cycle_time_ns = int(stream.cycle_time*1e9)
+        next_cycle_time_ns = time.perf_counter_ns()
         stop_streaming = False
-        while not stop_streaming:
-            next_cycle_time += stream.cycle_time
-            stop_streaming, stream_values = stream.get_next_coordinate_set()
-            for i, driver in enumerate(self.drivers):
-                driver.stream(*stream_values[i])
-            self._wait_for_response_on_all()
-            while next_cycle_time - time.time() > 0:
-                time.sleep(next_cycle_time - time.time())
+        try:
+            while not stop_streaming:
+                next_cycle_time_ns += cycle_time_ns
+                stop_streaming, stream_values = stream.get_next_coordinate_set()
+                for i, driver in enumerate(self.drivers):
+                    driver.stream(*stream_values[i])
+                self._wait_for_response_on_all()
+                remaining_ns = next_cycle_time_ns - time.perf_counter_ns()
+                if remaining_ns > 0:
+                    time.sleep(remaining_ns/1e9)
+        finally:
+            gc.unfreeze()
         
         # Stops the stream.
         for driver in self.drivers:
             driver.stop_stream()
 
     def move_all_with_constant_velocity(self, velocity: npt.ArrayLike, acceleration: npt.ArrayLike | None = None) -> tuple[npt.NDArray, npt.NDArray]:
-        velocity = np.asarray(velocity)
+        # Converted to lists once so the drivers get native floats instead of indexing the arrays per driver.
+        velocity = np.asarray(velocity).tolist()
         if acceleration is None:
-            acceleration = np.full_like(velocity, 10.0)
+            acceleration = [10.0]*len(velocity)
         else:
-            acceleration = np.asarray(acceleration)
+            acceleration = np.asarray(acceleration).tolist()
         for i, driver in enumerate(self.drivers):
             self.futures[i] = driver.move_with_constant_velocity(velocity[i], acceleration[i])
-        positions, velocities = np.array(self._read_from_futures()).T
-        return positions, velocities
+        return self._read_positions_and_velocities()
 
     def go_to_pos(self, position: npt.ArrayLike, velocity: npt.ArrayLike, acceleration: npt.ArrayLike | None = None) -> tuple[npt.NDArray, npt.NDArray]:
         for i, driver in enumerate(self.drivers):
             self.futures[i] = driver.go_to_pos(position[i], velocity[i], acceleration[i])
-        return np.array(self._read_from_futures()).T
+        return self._read_positions_and_velocities()
 
     def follow_path(self, stepper: PathFollower, max_cycles: int | None = None, debug_interval: int = 1, telemetry: Telemetry | None = None) -> None:
        
         path_logger.info("Starting feedback loop with velocity tracking...")
         
         cycle_count = 0
-        last_commanded_velocity = np.zeros(len(self.drivers))
-        last_commanded_acceleration = np.ones(len(self.drivers))*3
+        n = len(self.drivers)
+        zeros_n = [0]*n
+        last_commanded_velocity = np.zeros(n)
+        last_commanded_acceleration = np.ones(n)*3
         
         # Time tracking for telemetry
         t0 = time.time()
@@ -162,7 +195,7 @@ class Controller:
         while True:
             try:
                 # Get current position and velocity state
-                position = np.empty(len(self.drivers))
+                position = np.empty(n)
                 for i, driver in enumerate(self.drivers):
                     position[i] = driver.min_pos if last_commanded_velocity[i] < 0.0 else driver.max_pos
                 positions, actual_velocities = self.go_to_pos(
@@ -185,7 +218,7 @@ class Controller:
                 
                 if complete:
                     path_logger.info("Path following completed!")
-                    self.move_all_with_constant_velocity([0]*len(self.drivers))
+                    self.move_all_with_constant_velocity(zeros_n)
                     return
                 
                 last_commanded_velocity = next_velocity.copy()
@@ -197,9 +230,9 @@ class Controller:
                 
                 cycle_count += 1
 
-                if cycle_count is not None and max_cycles is not None and cycle_count > max_cycles:
+                if max_cycles is not None and cycle_count >= max_cycles:
                     path_logger.info(f"Max cycles of {max_cycles} cycles reached. Stopping drivers.")
-                    self.move_all_with_constant_velocity([0]*len(self.drivers))
+                    self.move_all_with_constant_velocity(zeros_n)
                     return
             
             except Exception as e1:
@@ -5,12 +5,16 @@ import time
 import queue
 import threading
 import functools
+import os
 from concurrent.futures import Future
 
 return_type = TypeVar("R")
 parameter_types = ParamSpec("T")
+observed_type = TypeVar("O")
 
 class DriveError(Exception):
+    __slots__ = ('error_code', 'drive')
+
     def __init__(self, drive: "Driver", error_code: int, post_message: str = "") -> None:
         message = f"Error code {error_code} raised by '{drive.name}'." + post_message
         self.error_code = error_code
@@ -18,12 +22,33 @@ class DriveError(Exception):
         super().__init__(message)
 
 class MonitoringChannelMissingParameterError(Exception):
+    __slots__ = ()
+
     def __init__(self, missing_parameter_name: str) -> None:
         message = f"Monitoring channel not configured correctly. Expected '{missing_parameter_name}' " + \
                    "but was not found. Check either driver or manipulator configuration."
         super().__init__(message)
 
+# Setters of the stream values for each stream type. One of these is selected by 'Driver.initialize_stream'.
+def _set_P_stream_values(MC_interface: io.MotionCommmandInterface, target_position: float, target_velocity: None, target_acceleration: None) -> None:
+    MC_interface.set_MC_parameter_value(0, target_position)
+
+def _set_PV_stream_values(MC_interface: io.MotionCommmandInterface, target_position: float, target_velocity: float, target_acceleration: None) -> None:
+    MC_interface.set_MC_parameter_value(0, target_position)
+    MC_interface.set_MC_parameter_value(1, target_velocity)
+
+def _set_PVA_stream_values(MC_interface: io.MotionCommmandInterface, target_position: float, target_velocity: float, target_acceleration: float) -> None:
+    MC_interface.set_MC_parameter_value(0, target_position)
+    MC_interface.set_MC_parameter_value(1, target_velocity)
+    MC_interface.set_MC_parameter_value(2, target_acceleration)
+
 class Driver:
+    # The driver is accessed at every command, so the attributes are stored in slots instead of an instance dict.
+    __slots__ = ('min_pos', 'max_pos', 'IP', 'name', 'datagram', 'response_timeout', 'max_send_attempts', 
+                 'monitoring_channel_parameters', 'awaiting_error_acknowledgement', '_method_queue', 
+                 '_thread', 'logger', 'warning_words', 'MC_count', 'realtime_config_command_count', 'MC_count_up_to_date', 
+                 'realtime_config_count_up_to_date', 'stream_type', 'stream_request', '_stream_package', '_set_stream_values', 'cpu_affinity', 'rt_priority', 
+                 '_state_var_request', '_driver_time_request', '_status_word_request', '_realtime_config_count_request')
 
     def __init__(self, 
                  IP: str, 
@@ -34,12 +59,14 @@ class Driver:
                  min_pos: float,
                  max_pos: float,
                  monitoring_channel_parameters: tuple[io.CommandParameter | None] = (None, None, None, None),
+                 cpu_affinity: set[int] | None = None,
+                 rt_priority: int | None = None,
                  ) -> None:
         """
         The high-level interface for the linMot drivers such as homing, switch on, basic motion commands etc. Every instance contains its 
         own thread such that any two drivers doesn't have to wait for a response from the other. Methods that are multithreaded are decorated 
-        with the 'run_on_driver_thread'. In case the driver is in an error-state any call to a method that is decorated with the 
-        'ignored_if_awaiting_error_acknowledgement' is ignored to prevent further errors to arise. If the driver itself throws an error 
+        with the 'run_on_driver_thread'. In case the driver is in an error-state any call to a method that is decorated with 
+        'run_on_driver_thread' (unless 'ignored_if_awaiting_error_acknowledgement=False') is ignored to prevent further errors to arise. If the driver itself throws an error 
         a DriverError exception is raised which can be used to handle errors specifically related to the linMot driver. Use the
         'acknowledge_error' method to attempt to acknowledge any present driver errors.
 
@@ -64,20 +91,24 @@ class Driver:
             monitoring channel parameters to be present. If these methods are called and the parameters are not 
             configured in this instance or in the driver firmware accordingly, a 'MonitoringChannelMissingParameterError' 
             exception is raised.
+        cpu_affinity : set[int] | None, optional
+            The CPUs to pin the driver thread to, e.g. the core handling the interrupts of the network card. Only 
+            supported on Linux. Default is None (no pinning).
+        rt_priority : int | None, optional
+            If given, the driver thread is scheduled with SCHED_FIFO at this priority (1-99) for low-jitter streaming. 
+            Only supported on Linux and usually requires elevated privileges. Default is None (default scheduling).
 
         Additional attributes
         ---------------------
         awaiting_error_acknowledgement : bool
-            The awaiting error acknowledge flag. If True, and class method with the 'ignore_if_awaiting_error_acknowledgement'
-            decorator is ignored.
-        _send_attempt : int
-            Local variable that increments in case of recieve timeouts. Resets when package is recieved.
+            The awaiting error acknowledge flag. If True, any class method run on the driver thread with 
+            'ignored_if_awaiting_error_acknowledgement' is ignored.
         logger : logging.Logger
             The logging module for this driver.
         MC_count : int
-            The current motion command counts. Is incremented at every motion command (only 4-bits).
+            The current motion command counts. Is incremented at every motion command and wraps at 4-bits.
         realtime_config_command_count : int
-            The current realtime config command counts. Is incremented at every motion command (only 4-bits).
+            The current realtime config command counts. Is incremented at every realtime config command and wraps at 4-bits.
         MC_count_up_to_date : bool
             If the motion command count is synched with the drivers motion command count.
         realtime_config_count_up_to_date : bool
@@ -95,27 +126,53 @@ class Driver:
         self.response_timeout = response_timeout
         self.max_send_attempts = max_send_attempts
         self.monitoring_channel_parameters = monitoring_channel_parameters
+        self.cpu_affinity = cpu_affinity
+        self.rt_priority = rt_priority
         
         # Setting up the driver thread.
-        self._method_queue: queue.Queue[tuple[Callable, tuple[Any], dict[Any], Future]] = queue.Queue()
+        self._method_queue: queue.Queue[tuple[Callable, tuple[Any], dict[Any], Future, bool]] = queue.Queue()
         self._thread = threading.Thread(target=self._run_method_queue, name=name)
         self._thread.start()
         
-        # The awaiting error acknowledge flag. If True, and class method with the 'ignore_if_awaiting_error_acknowledgement'
-        # decorator is ignored.
+        # The awaiting error acknowledge flag. If True, any class method run on the driver thread with 
+        # 'ignored_if_awaiting_error_acknowledgement' is ignored.
         self.awaiting_error_acknowledgement = False
-        # Local variable that increments in case of recieve timeouts. Resets when package is recieved. 
-        self._send_attempt = 1
         # Local logger module.
         self.logger = logging.getLogger(self.name)
-        # A list of driver warnings is kept so that it is known when a change in the warn word is registred.
-        self.warning_words: list[io.responses.WarnWord] = list()
-        # The current motion command counts. Is incremented at every motion command (only 4-bits).
+        # The present driver warnings (keyed by their bit) are kept so that it is known when a change in the warn word is registred.
+        self.warning_words: dict[int, io.responses.WarnWord] = dict()
+        # The current command counts. Are incremented at every command and wrap at 4-bits such that they can be sent as is.
         self.MC_count = 0
         self.realtime_config_command_count = 0
         # Flags to determine if the command count is up to date with the drivers command count.
         self.MC_count_up_to_date = False
         self.realtime_config_count_up_to_date = False
+        # Requests that are the same at every call are only constructed once.
+        self._state_var_request = io.Request(io.Response(state_var=True))
+        self._driver_time_request = io.Request(realtime_config=realtime_config_commands.Read_RAM_Value_of_Parameter_by_UPID(
+            0x1CAF, io.linTypes.Uint32, 'slave timer value', 'mym'))
+        self._status_word_request = io.Request(realtime_config=realtime_config_commands.Read_RAM_Value_of_Parameter_by_UPID(
+            0x1D51, io.linTypes.Uint16, 'status word', '-'))
+        self._realtime_config_count_request = io.Request(realtime_config=realtime_config_commands.No_Operation())
+
+        self._configure_thread_scheduling()
+
+    def _configure_thread_scheduling(self) -> None:
+        """
+        Pins the driver thread to 'cpu_affinity' and schedules it with SCHED_FIFO at 'rt_priority' if these are given.
+        If the platform or the privileges of the process doesn't allow it, the driver thread keeps the default scheduling.
+        """
+        thread_id = self._thread.native_id
+        if self.cpu_affinity is not None:
+            try:
+                os.sched_setaffinity(thread_id, self.cpu_affinity)
+            except (AttributeError, OSError) as e:
+                self.logger.warning(f"Unable to pin driver thread to CPU(s) {self.cpu_affinity}: {e}.")
+        if self.rt_priority is not None:
+            try:
+                os.sched_setscheduler(thread_id, os.SCHED_FIFO, os.sched_param(self.rt_priority))
+            except (AttributeError, OSError) as e:
+                self.logger.warning(f"Unable to set realtime priority {self.rt_priority} of driver thread: {e}.")
 
     def _run_method_queue(self) -> None:
         """
@@ -124,43 +181,50 @@ class Driver:
         """
         while threading.main_thread().is_alive() or self._method_queue.qsize() != 0:
             try:
-                method, args, kwargs, future = self._method_queue.get(timeout=1)
+                method, args, kwargs, future, ignored_if_awaiting_error_acknowledgement = self._method_queue.get(timeout=1)
             except queue.Empty:
                 # Ensures that the driver thread is not blocked forever if the main thread is killed while waiting.
                 continue
+
+            # Ignores the method if the driver is in an error-state.
+            if ignored_if_awaiting_error_acknowledgement and self.awaiting_error_acknowledgement:
+                future.set_result(None)
+                continue
             
-            # Runs the method.
+            # Runs the method. The queue only holds methods of this instance, so they are queued unbound.
             try:
-                method_result = method(*args, **kwargs)
+                method_result = method(self, *args, **kwargs)
             except Exception as e:
                 future.set_exception(e)
             else:
                 future.set_result(method_result)
 
     @staticmethod
-    def run_on_driver_thread(method: Callable[parameter_types, return_type]) -> Callable[parameter_types, Future]:
+    def run_on_driver_thread(ignored_if_awaiting_error_acknowledgement: bool = True
+                             ) -> Callable[[Callable[parameter_types, return_type]], Callable[parameter_types, Future]]:
         """
         The decorator method which methods will be put into the class thread queue.
-        """
-        @functools.wraps(method)
-        def wrapper(self: Self, *args, **kwargs) -> Future:
-            future = Future()
-            self._method_queue.put((method.__get__(self, type(self)), args, kwargs, future))
-            return future
-        return wrapper
 
-    @staticmethod
-    def ignored_if_awaiting_error_acknowledgement(method: Callable[parameter_types, return_type]) -> Callable[parameter_types, return_type | None]:
-        @functools.wraps(method)
-        def wrapper(self: Self, *args, **kwargs) -> return_type | None:
-            if not self.awaiting_error_acknowledgement:
-                return method(self, *args, **kwargs)
-        return wrapper
+        Parameters
+        ----------
+        ignored_if_awaiting_error_acknowledgement : bool, optional
+            If True, the method is not run (and the result of the future is None) when the driver is 
+            awaiting error acknowledgement. The check is done on the driver thread right before the 
+            method would run. Default is True.
+        """
+        def decorator(method: Callable[parameter_types, return_type]) -> Callable[parameter_types, Future]:
+            @functools.wraps(method)
+            def wrapper(self: Self, *args, **kwargs) -> Future:
+                future = Future()
+                self._method_queue.put((method, args, kwargs, future, ignored_if_awaiting_error_acknowledgement))
+                return future
+            return wrapper
+        return decorator
 
     def send(self, request: io.Request) -> io.TranslatedResponse:
         """
-        Attempts to send a request to the drive. If no response is recieved within 'resonse_timeout' it attempts again
-        until 'self._send_attempts == self.max_send_attempts'. This method is not decorated by 'run_on_driver_thread' since
+        Attempts to send a request to the drive. If no response is recieved within 'resonse_timeout' the same package is 
+        sent again, up to 'max_send_attempts' times in total. This method is not decorated by 'run_on_driver_thread' since
         some packages sent might not need to be run in parallel.
 
         Parameters
@@ -180,59 +244,76 @@ class Driver:
         """
         # If the request is a motion command, ensure that the count is incremented and up to date.
         if request.MC_interface is not None:
-            if not self.MC_count_up_to_date:
-                self.MC_count = self.get_MC_count()
-                self.MC_count_up_to_date = True
-            self.MC_count += 1
+            self._increment_MC_count()
 
         if request.realtime_config is not None:
             if not self.realtime_config_count_up_to_date:
                 self.realtime_config_count_up_to_date = True
                 self.realtime_config_command_count = self.get_realtime_config_command_count()
-            self.realtime_config_command_count += 1
-
-        # Maps the counts from 'python int' to Uint4 with overflow.
-        mapped_MC_count = self.MC_count & 0xF
-        mapped_realtime_config_command_count = self.realtime_config_command_count & 0xF
+            self.realtime_config_command_count = (self.realtime_config_command_count + 1) & 0xF
 
         # Sends the request.
-        package = request.get_binary(mapped_MC_count, mapped_realtime_config_command_count)
-        
-        self.datagram.send(package, self.IP)
+        package = request.get_binary(self.MC_count, self.realtime_config_command_count)
+        return self._transmit(request, package)
 
-        # Logging the send.
-        self.logger.log(request.logging_level, f"{request}.")
-        self.logger.binary(f"Request binary: {package}.")
+    def _increment_MC_count(self) -> None:
+        """
+        Increments the motion command count (as Uint4 with overflow) and ensures it is synched with the drive beforehand.
+        """
+        if not self.MC_count_up_to_date:
+            self.MC_count = self.get_MC_count()
+            self.MC_count_up_to_date = True
+        self.MC_count = (self.MC_count + 1) & 0xF
 
-        try:
-            # Wait for response (default timeout 2 seconds).
-            response_raw = self.datagram.recieve(self.IP, self.response_timeout)
+    def _transmit(self, request: io.Request, package: bytes | bytearray) -> io.TranslatedResponse:
+        """
+        Sends an already serialized request to the drive and handles the response. Called by 'send' and by 'stream', 
+        which patches a precomputed package instead of serializing the stream request at every call. On a recieve
+        timeout the same package is sent again such that the command counts are not incremented for a retry.
+
+        Parameters
+        ----------
+        request : io.Request
+            The request that 'package' is the binary of.
+        package : bytes | bytearray
+            The binary of the request.
+
+        Returns
+        -------
+        io.TranslatedResponse
+            A dict containing the translated response from the drive. Content depends on the request.
+        """
+        for send_attempt in range(1, self.max_send_attempts + 1):
+            self.datagram.send(package, self.IP)
+
+            # Logging the send. Formatting is deferred to the logger such that it is skipped when the level is disabled.
+            self.logger.log(request.logging_level, "%s.", request)
+            self.logger.binary("Request binary: %s.", package)
+
+            try:
+                # Wait for response (default timeout 2 seconds).
+                response_raw = self.datagram.recieve(self.IP, self.response_timeout)
+            except TimeoutError:
+                self.logger.warning(f"Response timed out ({self.response_timeout}s) at attempt {send_attempt}/{self.max_send_attempts}.")
+                continue
             
             # Translating the response.
             translated_response = request.response.translate_response(response_raw, request.realtime_config, self.monitoring_channel_parameters)
             
             # Logging the recieve.
-            self.logger.log(request.logging_level, f"Response recieved: {translated_response}.")
-            self.logger.binary(f"Response binary: {response_raw}")
+            self.logger.log(request.logging_level, "Response recieved: %s.", translated_response)
+            self.logger.binary("Response binary: %s", response_raw)
             
             # Warning handling.
             self._warning_handler(translated_response)
 
             # Error handling.
             self._error_handler(translated_response)
-            
-            # Reset attempt counter.
-            self._send_attempt = 1
 
             return translated_response
-        except queue.Empty:
-            self.logger.warning(f"Response timed out ({self.response_timeout}s) at attempt {self._send_attempt}/{self.max_send_attempts}.")
-            if self._send_attempt < self.max_send_attempts:
-                self._send_attempt += 1
-                return self.send(request)
-            else:
-                self.logger.critical("Unable to recieve.")
-                raise TimeoutError(f"Unable to recieve from '{self.name}'.")
+
+        self.logger.critical("Unable to recieve.")
+        raise TimeoutError(f"Unable to recieve from '{self.name}'.")
 
     def get_main_state(self) -> int:
         """
@@ -244,15 +325,14 @@ class Driver:
             The main state of the drive.
         """
         self.logger.debug("Requesting main state.")
-        return self.send(io.Request(io.Response(state_var=True))).state_var.main_state
+        return self.send(self._state_var_request).state_var.main_state
 
     def get_MC_count(self) -> int:
         self.logger.debug("Requesting MC_count.")
-        MC_count = self.send(io.Request(io.Response(state_var=True))).state_var.MC_count
+        MC_count = self.send(self._state_var_request).state_var.MC_count
         return MC_count if MC_count is not None else 0
 
-    @run_on_driver_thread
-    @ignored_if_awaiting_error_acknowledgement
+    @run_on_driver_thread()
     def home(self, timeout: float = 30, overwrite_already_home_check: bool = False) -> bool:
         """
         Sends a command to home the LinMot motors. The drive must be in state 8.
@@ -272,15 +352,14 @@ class Driver:
         self.logger.info("Homing procedure initiated.")
 
         # Checks if the driver is already homed.
-        state_var = self.send(io.Request(io.Response(state_var=True))).state_var
+        state_var = self.send(self._state_var_request).state_var
         if state_var.homed and not overwrite_already_home_check:
             self.logger.info("Homing procedure completed (already homed).")
             return True
 
         # Confirms if the drive is ready to be homed.
-        main_state = self.get_main_state()
         if state_var.main_state != 8:
-            self.logger.error(f"Homing procedure failed: Not in correct state ({main_state} != 8).")
+            self.logger.error(f"Homing procedure failed: Not in correct state ({state_var.main_state} != 8).")
             return False
 
         # Sending home request.
@@ -288,10 +367,10 @@ class Driver:
         self.send(home_request)
 
         # Waiting for homing to finish.
-        is_homing_finished_request = io.Request(io.Response(state_var=True))
-        is_homing_finished = lambda: self.send(is_homing_finished_request).state_var.homing_finished
-        if not self.wait_for_change(is_homing_finished, timeout, 1):
-            self.logger.error(f"Homing procedure failed: Timed out ({timeout}s). Switching off drive.")
+        get_state_var = lambda: self.send(self._state_var_request).state_var
+        is_homing_finished, state_var = self.wait_for_change(get_state_var, lambda state_var: state_var.homing_finished, timeout, 1)
+        if not is_homing_finished:
+            self.logger.error(f"Homing procedure failed: Timed out ({timeout}s) in state {state_var.main_state}. Switching off drive.")
             self.send(io.Request(io.Response(), io.ControlWord()))
             return False
         
@@ -301,8 +380,7 @@ class Driver:
         self.logger.info("Homing procedure completed.")
         return True
 
-    @run_on_driver_thread
-    @ignored_if_awaiting_error_acknowledgement
+    @run_on_driver_thread()
     def switch_on(self, timeout: float = 5) -> bool:
         """
         Switches on the drive by setting the main state to 8 from either state 0 or 2.
@@ -328,46 +406,56 @@ class Driver:
             self.send(io.Request(io.Response(), io.ControlWord()))
 
             # Waiting for main state to go state 2.
-            if not self.wait_for_change(lambda: self.get_main_state() == 2, timeout=timeout, delay=0.2):
-                self.logger.error(f"Switch on procedure failed: Timed out going to state 2 ({timeout}s). Current state is {self.get_main_state()}.")
+            is_state_2, main_state = self.wait_for_change(self.get_main_state, lambda main_state: main_state == 2, timeout=timeout, delay=0.2)
+            if not is_state_2:
+                self.logger.error(f"Switch on procedure failed: Timed out going to state 2 ({timeout}s). Current state is {main_state}.")
                 return False
-
-            main_state = self.get_main_state()
         
         if main_state == 2:
             # Requesting state 8.        
             self.send(io.Request(io.Response(), io.ControlWord(switch_on=True)))
 
             # Waiting for state 8.
-            if not self.wait_for_change(lambda: self.get_main_state() == 8, timeout=timeout, delay=0.2):
-                self.logger.error(f"Switch on procedure failed: Timed out going from state 2 to 8 ({timeout}s). Current state is {self.get_main_state()}.")
+            is_state_8, main_state = self.wait_for_change(self.get_main_state, lambda main_state: main_state == 8, timeout=timeout, delay=0.2)
+            if not is_state_8:
+                self.logger.error(f"Switch on procedure failed: Timed out going from state 2 to 8 ({timeout}s). Current state is {main_state}.")
                 return False
             
             # Finalizing.
             self.logger.info("Switch on procedure completed.")
             return True
 
-    def wait_for_change(self, change_checker: Callable[[None], bool], timeout: float, delay: float = 0.0) -> bool:
+    def wait_for_change(self, observer: Callable[[], observed_type], change_checker: Callable[[observed_type], bool], 
+                        timeout: float, delay: float = 0.0) -> tuple[bool, observed_type]:
         """
         Procedure that waits for a given change to happen in the drive.
 
         Parameters
         ----------
-        change_checker : Callable[[None], bool]
-            The criteria to check at 'delay' intervals.
+        observer : Callable[[], observed_type]
+            Reads the value to check from the drive at 'delay' intervals.
+        change_checker : Callable[[observed_type], bool]
+            The criteria to check on the observed value.
         timeout : float
             The amount of time to wait for the change to happen before considering the change to not happen.
         delay : float, optional
             The time between checking the criteria. Default is as fast as possible.
+
+        Returns
+        -------
+        tuple[bool, observed_type]
+            Whether or not the change happened and the last observed value. The observed value can be used
+            by the caller instead of requesting it again from the drive.
         """
-        start_time = time.time()
-        current_time = time.time()
-        while not change_checker():
-            if current_time - start_time >= timeout:
-                return False
-            current_time = time.time()
+        # Monotonic time is used so the timeout is unaffected by adjustments of the system clock.
+        deadline = time.monotonic() + timeout
+        observed_value = observer()
+        while not change_checker(observed_value):
+            if time.monotonic() >= deadline:
+                return False, observed_value
             time.sleep(delay)
-        return True
+            observed_value = observer()
+        return True, observed_value
     
     def _error_handler(self, translated_response: io.TranslatedResponse) -> None:
         error_code: int = translated_response.error_code
@@ -392,24 +480,22 @@ class Driver:
         # Exit warning handler if the resonse didn't request a warning.        
         if warning_words is None: return None
 
-        # Gets the already present and new warning bits (to make it easier for comparison).
-        already_present_warning_bits = {warning_word.bit for warning_word in self.warning_words}
-        new_warning_bits = {warning_word.bit for warning_word in warning_words}
+        # Gets the new warnings keyed by their bit (to make it easier for comparison).
+        new_warning_words = {warning_word.bit: warning_word for warning_word in warning_words}
         
-        # Inserts new warnings into the warnings list if present.
-        for new_warning_word in warning_words:
-            if new_warning_word.bit not in already_present_warning_bits:
-                self.warning_words.append(new_warning_word)
+        # Inserts new warnings if present.
+        for bit, new_warning_word in new_warning_words.items():
+            if bit not in self.warning_words:
+                self.warning_words[bit] = new_warning_word
                 self.logger.warning(f"{new_warning_word.name}: {new_warning_word.meaning}.")
         
-        # Removes lifted warnings from the list.
-        for i, already_present_warning in enumerate(self.warning_words):
-            if already_present_warning.bit not in new_warning_bits:
-                self.logger.info(f"Warning cleared: '{already_present_warning.name}'.")
-                self.warning_words.pop(i)
-
-    @run_on_driver_thread
-    @ignored_if_awaiting_error_acknowledgement
+        # Removes lifted warnings. Iterates over a copy of the bits since warnings are removed while iterating.
+        for bit in list(self.warning_words):
+            if bit not in new_warning_words:
+                self.logger.info(f"Warning cleared: '{self.warning_words[bit].name}'.")
+                del self.warning_words[bit]
+
+    @run_on_driver_thread()
     def initialize_stream(self, stream_type: Literal['P', 'PV', 'PVA']) -> None:
         self.logger.info('Initializing stream.')
 
@@ -418,44 +504,45 @@ class Driver:
         if main_state != 8:
             self.logger.error(f"Drive not in correct state for streaming ({main_state != 8}).")
 
+        # The setter of the stream values is selected here so that 'stream' doesn't have to dispatch on the stream type.
         self.stream_type: Literal['P', 'PV', 'PVA'] = stream_type
         match stream_type:
             case 'P':
                 self.stream_request = io.Request(
+                    io.Response(),
                     MC_interface=motion_commands.P_Stream_With_Slave_Generated_Time_Stamp_and_Configured_Period_Time(0))
+                self._set_stream_values = _set_P_stream_values
             case 'PV':
                 self.stream_request = io.Request(
+                    io.Response(),
                     MC_interface=motion_commands.PV_Stream_With_Slave_Generated_Time_Stamp(0, 0))
+                self._set_stream_values = _set_PV_stream_values
             case 'PVA':
                 self.stream_request = io.Request(
+                    io.Response(),
                     MC_interface=motion_commands.PVA_Stream_With_Slave_Generated_Time_Stamp_and_Configured_Period_Time(0, 0, 0))
+                self._set_stream_values = _set_PVA_stream_values
             case _:
                 raise ValueError(f"Parameter 'stream_type' expected eiter 'P', 'PV', or 'PVA' but got {stream_type}.")
 
-    @run_on_driver_thread
-    @ignored_if_awaiting_error_acknowledgement
+        # The stream request is serialized once. Only the motion command part of the package (count and values) is
+        # patched in place at every stream call since the rest of the package is the same for every sample.
+        # The request gets its own response above since the header is frozen here, a shared default response could
+        # carry flags left over from an earlier request into every sample.
+        self._stream_package = bytearray(self.stream_request.get_binary(0, 0))
+
+    @run_on_driver_thread()
     def stream(self, target_position: float, target_velocity: float | None = None, target_acceleration: float | None = None) -> None:
-        # Structure is for speed.
-        match self.stream_type:
-            case 'P':
-                self.stream_request.MC_interface.set_MC_parameter_value(0, target_position)
-            case 'PV':
-                self.stream_request.MC_interface.set_MC_parameter_value(0, target_position)
-                self.stream_request.MC_interface.set_MC_parameter_value(1, target_velocity)
-            case 'PVA':
-                self.stream_request.MC_interface.set_MC_parameter_value(0, target_position)
-                self.stream_request.MC_interface.set_MC_parameter_value(1, target_velocity)
-                self.stream_request.MC_interface.set_MC_parameter_value(2, target_acceleration)
-            case _:
-                raise ValueError
-        self.send(self.stream_request)
+        self._set_stream_values(self.stream_request.MC_interface, target_position, target_velocity, target_acceleration)
+        self._increment_MC_count()
+        self.stream_request.MC_interface.pack_into(self._stream_package, self.stream_request.MC_interface_offset, self.MC_count)
+        self._transmit(self.stream_request, self._stream_package)
 
-    @run_on_driver_thread
-    @ignored_if_awaiting_error_acknowledgement
+    @run_on_driver_thread()
     def stop_stream(self) -> None:
         self.send(io.Request(MC_interface=motion_commands.Stop_Streaming()))
 
-    @run_on_driver_thread
+    @run_on_driver_thread(ignored_if_awaiting_error_acknowledgement=False)
     def acknowledge_error(self) -> None:
         """
         Attempts to acknowledge any error(s) on the driver if any is present. This is done by first acknowledging the present error
@@ -493,26 +580,20 @@ class Driver:
 
         self.awaiting_error_acknowledgement = False
 
-    @run_on_driver_thread
-    @ignored_if_awaiting_error_acknowledgement
+    @run_on_driver_thread()
     def get_driver_time(self) -> float:
-        realtime_config_cmd = realtime_config_commands.Read_RAM_Value_of_Parameter_by_UPID(0x1CAF, io.linTypes.Uint32, 'slave timer value', 'mym')
-        return self.send(io.Request(realtime_config=realtime_config_cmd)).realtime_config.values[1]
+        return self.send(self._driver_time_request).realtime_config.values[1]
     
-    @ignored_if_awaiting_error_acknowledgement
-    def get_realtime_config_command_count(self) -> int:
+    def get_realtime_config_command_count(self) -> int | None:
+        if self.awaiting_error_acknowledgement: return None
         self.logger.debug("Requesting realtime_config count.")
-        realtime_config_cmd = realtime_config_commands.No_Operation()
-        return self.send(io.Request(realtime_config=realtime_config_cmd)).realtime_config.command_count
+        return self.send(self._realtime_config_count_request).realtime_config.command_count
     
-    @run_on_driver_thread
-    @ignored_if_awaiting_error_acknowledgement
+    @run_on_driver_thread()
     def get_status_word(self) -> int:
-        realtime_config_cmd = realtime_config_commands.Read_RAM_Value_of_Parameter_by_UPID(0x1D51, io.linTypes.Uint16, 'status word', '-')
-        return self.send(io.Request(realtime_config=realtime_config_cmd)).realtime_config.values[1]
+        return self.send(self._status_word_request).realtime_config.values[1]
     
-    @run_on_driver_thread
-    @ignored_if_awaiting_error_acknowledgement
+    @run_on_driver_thread()
     def move_with_constant_velocity(self, velocity: float, acceleration: float = 10.0) -> tuple[float, float]:
 
         if velocity > 0.0 and acceleration > 0.0:
@@ -535,8 +616,7 @@ class Driver:
         except KeyError:
             raise MonitoringChannelMissingParameterError('velocity')
         
-    @run_on_driver_thread
-    @ignored_if_awaiting_error_acknowledgement
+    @run_on_driver_thread()
     def go_to_pos(self, position: float, velocity: float, acceleration: float) -> tuple[float, float]:
         if velocity < 0.0 or acceleration < 0.0:
             self.logger.error("go_to_pos recieved signed velocity or acceleration.")
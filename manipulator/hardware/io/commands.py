@@ -57,6 +57,11 @@ class MotionCommmandInterface(ABC):
             The values corresponding to the motion command parameters.
         format : str
             The binary format of the package to send to the drive.
+        format_struct : struct.Struct
+            The precompiled 'format' used to pack the package.
+        conversion_factors : tuple[int | float]
+            The conversion factors of the motion command parameters. Kept separately so setting a value doesn't have to
+            look up the parameter specification.
         MASTER_ID : int
             The master ID of the command.
         SUB_ID : int
@@ -66,8 +71,10 @@ class MotionCommmandInterface(ABC):
         """
         if len(MC_parameters) != len(values): raise ValueError("Amount of parameters didn't match amount of values.")
         self.MC_PARAMETERS = MC_parameters
-        self.values = [int(value * self.MC_PARAMETERS[i].conversion_factor) for i, value in enumerate(values)]
+        self.conversion_factors = tuple(MC_parameter.conversion_factor for MC_parameter in self.MC_PARAMETERS)
+        self.values = [int(value * self.conversion_factors[i]) for i, value in enumerate(values)]
         self.format = "<H" + "".join([MC_parameter.type.format for MC_parameter in self.MC_PARAMETERS])
+        self.format_struct = struct.Struct(self.format)
 
     def get_header_decimal(self, MC_COUNT: int) -> int:
         """
@@ -101,7 +108,23 @@ class MotionCommmandInterface(ABC):
         bytes
             The full binary send package.
         """
-        return struct.pack(self.format, self.get_header_decimal(MC_COUNT), *self.values)
+        return self.format_struct.pack(self.get_header_decimal(MC_COUNT), *self.values)
+
+    def pack_into(self, buffer: bytearray, offset: int, MC_COUNT: int) -> None:
+        """
+        Writes the binary of the motion command into an already serialized package. Used to update
+        a precomputed package without serializing the full package again.
+
+        Parameters
+        ----------
+        buffer : bytearray
+            The serialized package to write into.
+        offset : int
+            The byte offset of the motion command in the package.
+        MC_COUNT : int
+            The current motion command count.
+        """
+        self.format_struct.pack_into(buffer, offset, self.get_header_decimal(MC_COUNT), *self.values)
 
     def set_MC_parameter_value(self, index: int, MC_value: int | float) -> None:
         """
@@ -116,7 +139,7 @@ class MotionCommmandInterface(ABC):
             The value of the parameter to change with the units specified by the parameter
             specifications.
         """
-        self.values[index] = int(MC_value*self.MC_PARAMETERS[index].conversion_factor)
+        self.values[index] = int(MC_value*self.conversion_factors[index])
 
     def __repr__(self) -> str:
         cmd_ID = hex(self.MASTER_ID)[2:] + hex(self.SUB_ID)[2:]
@@ -158,6 +181,9 @@ class RealtimeConfig(ABC):
         self.DO_values = [int(DO_value * DO_parameters[i].conversion_factor) for i, DO_value in enumerate(DO_values)]
         self.DO_format = "<H"  + "".join((parameter.type.format for parameter in self.DO_parameters))
         self.DI_format = "<BB" + "".join((parameter.type.format for parameter in self.DI_parameters))
+        # Precompiled formats, since the formats are the same for every package of the command.
+        self.DO_struct = struct.Struct(self.DO_format)
+        self.DI_struct = struct.Struct(self.DI_format)
 
     def get_header_decimal(self, COMMAND_COUNT: int) -> int:
         """
@@ -190,7 +216,7 @@ class RealtimeConfig(ABC):
         bytes
             The full binary send package.
         """
-        return struct.pack(self.DO_format, self.get_header_decimal(COMMAND_COUNT), *self.DO_values)
+        return self.DO_struct.pack(self.get_header_decimal(COMMAND_COUNT), *self.DO_values)
 
     def get_response_byte_size(self) -> int:
         """
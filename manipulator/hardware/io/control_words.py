@@ -1,5 +1,7 @@
 import struct
 
+_CONTROL_WORD_STRUCT = struct.Struct("H")
+
 class ControlWord:
     
     def __init__(self, 
@@ -48,7 +50,7 @@ class ControlWord:
                (self.control_words_included['phase_search'          ]  <<  15 )
 
     def get_binary(self) -> bytes:
-        return struct.pack(self.format, self.decimal)
+        return _CONTROL_WORD_STRUCT.pack(self.decimal)
     
     @property
     def hex(self) -> str:
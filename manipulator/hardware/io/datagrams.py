@@ -13,7 +13,9 @@ class linUDP:
         self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         self.socket.bind(("", main_port))
 
-        self.response_queue: dict[str, queue.Queue] = dict()
+        # The drives respond to the main port, so a single listener sorts the responses by IP. SimpleQueue is used
+        # since it has a cheaper hand-off between the listener and the recieving thread than Queue.
+        self.response_queue: dict[str, queue.SimpleQueue] = dict()
         self._thread = threading.Thread(target=self.listen, name='listener_thread', daemon=True)
         self._thread.start()
 
@@ -28,10 +30,13 @@ class linUDP:
     def send(self, request: bytes, IP_address: str) -> None:
         self.socket.sendto(request, (IP_address, self.driver_port))
         if self.response_queue.get(IP_address) is None:
-            self.response_queue.update({IP_address: queue.Queue()})
+            self.response_queue.update({IP_address: queue.SimpleQueue()})
 
     def recieve(self, IP_address: str, timeout: float) -> bytes:
+        # Raises TimeoutError like a socket with a timeout if nothing is recieved in time.
         try:
             return self.response_queue[IP_address].get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError(f"No response recieved from {IP_address} within {timeout}s.") from None
         except KeyError:
             logger.error(f"An interface tried to recieve from {IP_address} but no request has been sent to this address yet.")
\ No newline at end of file
@@ -5,6 +5,8 @@ from .commands import RealtimeConfig
 import struct
 import logging
 
+_REQUEST_DEF_STRUCT = struct.Struct("<I")
+
 class Request:
     
     def __init__(self, 
@@ -35,7 +37,7 @@ class Request:
         self.logging_level = logging_level
 
     def get_binary(self, MC_count: int, realtime_config_command_count: int) -> bytes:
-        request_def = struct.pack("<I", 
+        request_def = _REQUEST_DEF_STRUCT.pack(
             ((self.control_word     is not None) << 0) | 
             ((self.MC_interface     is not None) << 1) |
             ((self.realtime_config  is not None) << 2)
@@ -48,6 +50,14 @@ class Request:
         data = control_word_binary + MC_interface_binary + realtime_config_binary
         return request_header + data
     
+    @property
+    def MC_interface_offset(self) -> int:
+        """
+        The byte offset of the motion command in the binary of the request (after the request and
+        response definitions and the control word).
+        """
+        return 8 + (2 if self.control_word is not None else 0)
+
     def __repr__(self) -> str:
         commands = []
         if self.control_word is not None: commands.append(f"control_word: {self.control_word}")
@@ -3,6 +3,14 @@ from typing import Any
 from .commands import RealtimeConfig
 from .commands import CommandParameter
 from dataclasses import dataclass, fields
+import functools
+
+_RESPONSE_DEF_STRUCT = struct.Struct("<I")
+_STATE_VAR_STRUCT = struct.Struct("BB")
+
+# Precompiled formats of the responses. The formats depend on the requested response and realtime config command
+# but only a few different combinations are used, so they are cached by their format string.
+_get_struct = functools.lru_cache(maxsize=None)(struct.Struct)
 
 class ResponseBase:
     def __repr__(self) -> str:
@@ -121,11 +129,11 @@ class Response:
         self.response_types_included['realtime_config'] = True if realtime_config_command is not None else False
         
         response_raw_format = "<LL" + self.get_format(realtime_config_command)
-        response_raw_length = struct.calcsize(response_raw_format)
         # Only unpacking the expected length of the raw response, which is usually the same as the length of the raw response
         # but realtime config commands can apparently respond with bytes from the previous response, giving more values than
-        # expected. Might be problematic for debugging when a response is wrongly translated.
-        response_unpacked: tuple[int] = struct.unpack(response_raw_format, response_raw[:response_raw_length])[2:]
+        # expected. Might be problematic for debugging when a response is wrongly translated. unpack_from reads the expected 
+        # length directly from the buffer without copying it.
+        response_unpacked: tuple[int] = _get_struct(response_raw_format).unpack_from(response_raw)[2:]
         translated_response = TranslatedResponse()
         i = 0
         for response_name, response_type_included in self.response_types_included.items():
@@ -154,7 +162,7 @@ class Response:
                         )
 
                     case "state_var":
-                        sub_state, main_state = struct.unpack('BB', response_type_value)
+                        sub_state, main_state = _STATE_VAR_STRUCT.unpack(response_type_value)
                         match main_state:
                             case 3:     # Setup error.
                                 response_type_translated_value = StateVar(main_state=main_state, 
@@ -311,7 +319,7 @@ class Response:
                                 format += parameter.type.format
                             else:
                                 format += "4x"
-                        monitoring_channel_values = struct.unpack(format, response_type_value)
+                        monitoring_channel_values = _get_struct(format).unpack(response_type_value)
                         response_type_translated_value = dict()
                         for i, monitoring_channel_parameter in enumerate(monitoring_channel_parameters):
                             if monitoring_channel_parameter is not None:
@@ -321,7 +329,7 @@ class Response:
 
                     case "realtime_config":
                         if realtime_config_command is None: raise ValueError(f"realtime_config is flagged for the response but is not in the request.")
-                        command_count, parameter_channel_status, *DI_values = struct.unpack(realtime_config_command.DI_format, response_type_value)
+                        command_count, parameter_channel_status, *DI_values = realtime_config_command.DI_struct.unpack(response_type_value)
                         match parameter_channel_status:
                             case 0x00:
                                 parameter_status_description = "OK, done"
@@ -388,14 +396,14 @@ class Response:
         # If the size of the response is less than 14 bytes (including request and response defs) 
         # padding is appended up till 14 bytes. Documentation says pappending is appended up till 64 bytes 
         # but that is not the case.
-        size = struct.calcsize(format)
+        size = _get_struct(format).size
         if size < 6:
             format += f"{6-size}x"
         return format
 
     @property
     def response_def(self) -> bytes:
-        return struct.pack("<I",
+        return _RESPONSE_DEF_STRUCT.pack(
             (self.response_types_included['status_word'        ]  <<      0       ) |
             (self.response_types_included['state_var'          ]  <<      1       ) |
             (self.response_types_included['actual_pos'         ]  <<      2       ) |
@@ -1,103 +1,266 @@
 
 from __future__ import annotations
+import functools
+import os
 import numpy as np
+import matplotlib
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgba
+from matplotlib.lines import Line2D
 from manipulator.control import Telemetry
 
-plt.style.use("seaborn-v0_8-darkgrid")
+try:
+    from numba import njit, prange, get_num_threads
+except ImportError:
+    njit = None  # NumPy fallback in _brute_force_distance
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:
+    cKDTree = None  # Every segment is scanned in _project_distance_to_polyline
 
 
 # ---------------------------------------------------------------------------
 # Geometry helper
 # ---------------------------------------------------------------------------
 
-def _project_distance_to_polyline(points_mm, waypoints_mm):
-  
-    P = np.asarray(points_mm, float)
-    W = np.asarray(waypoints_mm, float)
-
-    S, E = W[:-1], W[1:]          # segment start and end
-    V = E - S                     # segment vectors
+if njit is not None:
+    # Fast-math without the 'nnan'/'ninf' flags, the minimum starts at infinity
+    @njit(parallel=True, fastmath={'nsz', 'arcp', 'contract', 'afn', 'reassoc'}, cache=True)
+    def _proj_dist_nb(P, S, V, L2, C, R, d_out):
+        # Scalar loop over the segments per point, no temporaries; points run in parallel.
+        # Segments whose bounding sphere (center C, radius R) lies farther away than the closest segment found so far
+        # are skipped before the projection, compared squared so the skip costs no square root.
+        for i in prange(P.shape[0]):
+            min_d2 = np.inf
+            min_d = np.inf
+            for j in range(S.shape[0]):
+                dc2 = 0.0
+                for k in range(P.shape[1]):
+                    dck = P[i, k] - C[j, k]
+                    dc2 += dck * dck
+                bound = min_d + R[j]
+                if dc2 > bound * bound:
+                    continue
+                dot = 0.0
+                for k in range(P.shape[1]):
+                    dot += (P[i, k] - S[j, k]) * V[j, k]
+                t = min(max(dot / L2[j], 0.0), 1.0)
+                d2 = 0.0
+                for k in range(P.shape[1]):
+                    dk = P[i, k] - S[j, k] - t * V[j, k]
+                    d2 += dk * dk
+                if d2 < min_d2:
+                    min_d2 = d2
+                    min_d = np.sqrt(d2)
+            d_out[i] = min_d
+
+
+# Polylines from this many segments on look up their candidate segments in a KD-tree of the midpoints. Below it the
+# direct scan is faster (single thread, N=100k: the tree only won from about 2000 segments on self-crossing paths).
+_KDTREE_MIN_SEGMENTS = 2000
+
+# Candidate segments projected on at once in _nearest_segments_distance, bounds its (points, k, D) temporaries
+_KDTREE_CANDIDATE_BLOCK = 2**16
+
+
+@functools.lru_cache(maxsize=8)
+def _poly_precompute_cached(waypoint_bytes: bytes, shape: tuple[int, int], dtype: str):
+    W = np.frombuffer(waypoint_bytes, dtype=dtype).reshape(shape)
+
+    S, E = np.ascontiguousarray(W[:-1]), W[1:]   # segment start and end
+    V = E - S                                    # segment vectors
     L2 = np.maximum(np.sum(V * V, axis=1), 1e-12)  # segment lengths squared
+    C = 0.5 * (S + E)                            # segment midpoints
+    R = 0.5 * np.sqrt(np.sum(V * V, axis=1))     # segment bounding radii
+    for array in (S, V, L2, C, R):
+        array.flags.writeable = False            # shared between calls
+    # KD-tree of the midpoints, only used for long polylines
+    tree = cKDTree(C) if cKDTree is not None and len(S) >= _KDTREE_MIN_SEGMENTS else None
+    return S, V, L2, C, R, tree
+
+
+def _poly_precompute(waypoints_mm, dtype=np.float64):
+    # Segment data of the polyline, cached by content so repeated analysis of the same waypoints skips the setup
+    W = np.ascontiguousarray(waypoints_mm, dtype=dtype)
+    return _poly_precompute_cached(W.tobytes(), W.shape, W.dtype.str)
+
+
+def _brute_force_distance(P, S, V, L2, C, R):
+    # Every point against every segment, returned as float64. The numba kernel only pays off when it runs on several
+    # threads, on a single thread the streamed NumPy loop below is as fast or faster.
+    if njit is not None and get_num_threads() > 1:
+        d_out = np.empty(len(P))
+        _proj_dist_nb(P, S, V, L2, C, R, d_out)
+        return d_out
+
+    # Points against one segment at a time, keeping the running minimum of the squared distances so the N x M
+    # distance matrix is never materialized. The coordinates are streamed as contiguous columns (SoA).
+    N, M, D = len(P), len(S), P.shape[1]
+    P_T = np.ascontiguousarray(P.T)
+
+    # Per-point buffers, reused for every segment
+    best = np.full(N, np.inf, dtype=P.dtype)
+    PS = np.empty((D, N), dtype=P.dtype)
+    t = np.empty(N, dtype=P.dtype)
+    d2 = np.empty(N, dtype=P.dtype)
+    tmp = np.empty(N, dtype=P.dtype)
+
+    for j in range(M):
+        np.subtract(P_T, S[j][:, None], out=PS)          # vector from segment start to point
+        np.multiply(PS[0], V[j, 0], out=t)
+        for k in range(1, D):
+            np.multiply(PS[k], V[j, k], out=tmp)
+            t += tmp
+        np.divide(t, L2[j], out=t)
+        np.clip(t, 0.0, 1.0, out=t)                      # projection parameter on the segment
+        d2.fill(0.0)
+        for k in range(D):
+            np.multiply(t, V[j, k], out=tmp)
+            np.subtract(PS[k], tmp, out=tmp)             # point minus its projection on the segment
+            np.square(tmp, out=tmp)
+            d2 += tmp                                    # squared distance to the projection
+        np.minimum(best, d2, out=best)                   # closest segment so far
+    d_out = np.sqrt(best, dtype=np.float64)
+    return d_out
 
-    d_out = np.zeros(len(P))
-    for i, p in enumerate(P):
-        PS = p - S                               # vector from segment start to point
-        t = np.clip(np.einsum("ij,ij->i", PS, V) / L2, 0.0, 1.0)
-        proj = S + t[:, None] * V               # projection on each segment
-        d = np.linalg.norm(p - proj, axis=1)    # distance to each projection
-        d_out[i] = np.min(d)                    # closest segment
+
+def _nearest_segments_distance(P, S, V, L2, C, R, tree, k=8):
+    # Only the k segments with the nearest midpoints are projected on. Any other segment is at least
+    # (distance to the k-th midpoint - largest bounding radius) away, points where that bound doesn't rule them out
+    # are queried again with four times as many neighbors, so the result stays exact. Once that would be a sizable part
+    # of the polyline, the remaining points are scanned directly instead.
+    M, R_max = len(S), R.max()
+    d_out = np.empty(len(P))
+    todo = np.arange(len(P))
+    while len(todo):
+        if 8 * k > M:
+            d_out[todo] = _brute_force_distance(P[todo], S, V, L2, C, R)
+            break
+        unsure = []
+        step = max(1, _KDTREE_CANDIDATE_BLOCK // k)
+        for start in range(0, len(todo), step):
+            rows = todo[start:start + step]
+            dc, idx = tree.query(P[rows], k=k, workers=-1)
+
+            PS = P[rows, None, :] - S[idx]                               # (rows, k, D)
+            t = np.clip(np.sum(PS * V[idx], axis=2) / L2[idx], 0.0, 1.0)
+            PS -= t[:, :, None] * V[idx]
+            d = np.sqrt(np.sum(PS * PS, axis=2).min(axis=1), dtype=np.float64)
+            d_out[rows] = d
+            unsure.append(rows[dc[:, -1] - R_max < d])
+        todo = np.concatenate(unsure)
+        k *= 4
     return d_out
 
 
+def _project_distance_to_polyline(points_mm, waypoints_mm, dtype=np.float32):
+    # Computed in float32 by default, millimeter scale paths don't need float64 and it halves the memory traffic.
+    # The returned distances are float64.
+    P = np.ascontiguousarray(points_mm, dtype)
+    S, V, L2, C, R, tree = _poly_precompute(waypoints_mm, dtype)
+
+    # Long polylines look up the candidate segments in a KD-tree of the midpoints, short ones are scanned directly
+    if tree is not None:
+        return _nearest_segments_distance(P, S, V, L2, C, R, tree)
+    return _brute_force_distance(P, S, V, L2, C, R)
+
+
 # Path analysis
 # ---------------------------------------------------------------------------
 
-def plot_path_analysis(intended_waypoints_mm, telemetry: Telemetry,
-                       save_figure: bool = False) -> None:
+def _visual_decimate(xy, max_pts=20000):
+    # Every stride-th sample, matplotlib cannot resolve more points than this on screen anyway
+    stride = max(1, len(xy) // max_pts)
+    return xy[::stride]
 
-    # Directly trust telemetry.to_arrays() (no try/except / empty checks)
-    _, positions_mm, _, _ = telemetry.to_arrays()
 
-    intended = np.asarray(intended_waypoints_mm, dtype=float)
-    actual = np.asarray(positions_mm, dtype=float)
+@functools.lru_cache(maxsize=1)
+def _apply_style() -> None:
+    # Applied on the first plot instead of at import, so importing this module leaves matplotlib untouched
+    plt.style.use("seaborn-v0_8-darkgrid")
+    plt.rcParams["agg.path.chunksize"] = 10000  # Render long lines in chunks
 
-    
 
-    # Determine dimensionality (2 or 3). If telemetry provides only 1D, we'll treat as 2D with zeros.
-    n_axes = actual.shape[1] if actual.ndim == 2 else 1
+@functools.lru_cache(maxsize=1)
+def _use_agg() -> None:
+    # Switched once; every later figure renders on the Agg canvas and no GUI toolkit is started
+    matplotlib.use("Agg", force=True)
+
+
+def _headless(save_figure: bool) -> bool:
+    # Batch runs that only save the figure skip the GUI entirely. Opt-in with MPL_HEADLESS=1 since switching the
+    # backend closes every open figure of the process.
+    if save_figure and os.environ.get("MPL_HEADLESS") == "1":
+        _use_agg()
+        return True
+    return False
+
+
+# Artists of figures created by earlier calls, keyed by figure label. Reused as long as the figure is still open so
+# repeated analysis only updates the data instead of rebuilding every axis.
+_figure_artists: dict[str, dict] = {}
 
-    # Cross-track error (mm) to intended polyline (works for 2D or 3D)
-    errors_mm = _project_distance_to_polyline(actual, intended)
-    sample_indices = np.arange(len(errors_mm))
+
+def _reusable_artists(name: str) -> dict | None:
+    if plt.fignum_exists(name):
+        return _figure_artists.get(name)
+    _figure_artists.pop(name, None)
+    return None
+
+
+def _path_collection(ax, with_intended: bool) -> LineCollection:
+    # Actual (red, solid) and intended (blue, dashed) path drawn as a single artist, filled in by set_segments.
+    # The dense data artists are rasterized, titles, labels and legends stay vector.
+    n_paths = 2 if with_intended else 1
+    collection = LineCollection(
+        [np.empty((0, 2))] * n_paths,
+        colors=[to_rgba("r", 0.8), to_rgba("b", 0.6)][:n_paths],
+        linewidths=[1.5, 1.0][:n_paths],
+        linestyles=["-", "--"][:n_paths],
+    )
+    collection.set_rasterized(True)
+    ax.add_collection(collection)
+    return collection
+
+
+def _path_legend_handles(with_intended: bool) -> list[Line2D]:
+    handles = [Line2D([], [], color="r", linewidth=1.5, alpha=0.8, label="Actual Path")]
+    if with_intended:
+        handles.append(Line2D([], [], color="b", linestyle="--", linewidth=1.0, alpha=0.6, label="Intended Path"))
+    return handles
+
+
+def _create_path_figure(name: str, n_axes: int, plot_intended_xy: bool) -> dict:
+    _apply_style()
+    fig = plt.figure(name)
+    artists = {"fig": fig}
 
     # Layout: for 2 axes -> [XY | cross-track], for 3 axes -> [XY, XZ, 3D, cross-track]
     if n_axes == 2:
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6))
+        fig.set_size_inches(16, 6)
+        ax1, ax_err = fig.subplots(1, 2)
         fig.suptitle("Manipulator Path Analysis (2-axis)", fontsize=18, fontweight="bold", y=0.98)
-
-        # XY Path
-        ax1.plot(actual[:, 0], actual[:, 1], "r-", linewidth=1.5, label="Actual Path", alpha=0.8)
-        
-        if intended.shape[1] >= 2:
-            ax1.plot(intended[:, 0], intended[:, 1], "b--", linewidth=1.0, label="Intended Path", alpha=0.6)
-        ax1.set_title("XY Path Comparison")
-        ax1.set_xlabel("X (mm)")
-        ax1.set_ylabel("Y (mm)")
-        ax1.set_aspect("equal")
-        ax1.grid(True, alpha=0.3)
-        ax1.legend()
-
-        # Cross-track error
-        ax2.plot(sample_indices, errors_mm, "g-", linewidth=1.2)
-        
-        ax2.fill_between(sample_indices, errors_mm, alpha=0.2)
-        ax2.set_title("Cross-Track Error to Intended Path")
-        ax2.set_xlabel("Sample Number")
-        ax2.set_ylabel("Error (mm)")
-        ax2.grid(True, alpha=0.3)
-
     else:
         # Default to handling 3D or higher as 3D visualization + cross-track
-        fig = plt.figure(figsize=(16, 10))
+        fig.set_size_inches(16, 10)
         fig.suptitle("3D Manipulator Path Analysis Dashboard", fontsize=20, fontweight="bold", y=0.95)
-
-        # XY Path
         ax1 = fig.add_subplot(2, 2, 1)
-        ax1.plot(actual[:, 0], actual[:, 1], "r-", linewidth=1.5, label="Actual Path", alpha=0.8)
-        
-        ax1.plot(intended[:, 0], intended[:, 1], "b--", linewidth=1.0, label="Intended Path", alpha=0.6)
-        ax1.set_title("XY Path Comparison")
-        ax1.set_xlabel("X (mm)")
-        ax1.set_ylabel("Y (mm)")
-        ax1.set_aspect("equal")
-        ax1.grid(True, alpha=0.3)
-        ax1.legend()
 
+    # XY Path
+    artists["xy_paths"] = _path_collection(ax1, plot_intended_xy)
+    ax1.set_title("XY Path Comparison")
+    ax1.set_xlabel("X (mm)")
+    ax1.set_ylabel("Y (mm)")
+    ax1.set_aspect("equal")
+    ax1.grid(True, alpha=0.3)
+    ax1.legend(handles=_path_legend_handles(plot_intended_xy))
+
+    if n_axes != 2:
         # XZ Path
         ax2 = fig.add_subplot(2, 2, 2)
-        ax2.plot(actual[:, 0], actual[:, 2], "r-", linewidth=1.5, alpha=0.8)
-        ax2.plot(intended[:, 0], intended[:, 2], "b--", linewidth=1.0, alpha=0.6)
+        artists["xz_paths"] = _path_collection(ax2, True)
         ax2.set_title("XZ Path Comparison")
         ax2.set_xlabel("X (mm)")
         ax2.set_ylabel("Z (mm)")
@@ -105,32 +268,114 @@ def plot_path_analysis(intended_waypoints_mm, telemetry: Telemetry,
 
         # 3D Path
         try:
+            from mpl_toolkits.mplot3d.art3d import Line3DCollection
             ax3 = fig.add_subplot(2, 2, 3, projection="3d")
-            ax3.plot(intended[:, 0], intended[:, 1], intended[:, 2], "b-", linewidth=1.2, label="Intended")
-            ax3.plot(actual[:, 0], actual[:, 1], actual[:, 2], "r-", linewidth=1.2, label="Actual")
-            
+            # Intended (blue) and actual (red) path as one collection, projected together
+            artists["3d_paths"] = Line3DCollection(
+                [np.empty((0, 3))] * 2, colors=["b", "r"], linewidths=[1.2, 1.2], rasterized=True
+            )
+            ax3.add_collection3d(artists["3d_paths"])
+
             ax3.set_title("3D Path Comparison")
             ax3.set_xlabel("X (mm)")
             ax3.set_ylabel("Y (mm)")
             ax3.set_zlabel("Z (mm)")
-            ax3.legend()
+            ax3.legend(handles=[
+                Line2D([], [], color="b", linewidth=1.2, label="Intended"),
+                Line2D([], [], color="r", linewidth=1.2, label="Actual"),
+            ])
         except Exception:
             # Matplotlib 3D not available; skip 3D plot
             pass
 
         # Cross-track error (bottom-right)
-        ax4 = fig.add_subplot(2, 2, 4)
-        ax4.plot(sample_indices, errors_mm, "g-", linewidth=1.2)
-        
-        ax4.fill_between(sample_indices, errors_mm, alpha=0.2)
-        ax4.set_title("Cross-Track Error to Intended Path")
-        ax4.set_xlabel("Sample Number")
-        ax4.set_ylabel("Error (mm)")
-        ax4.grid(True, alpha=0.3)
+        ax_err = fig.add_subplot(2, 2, 4)
+
+    # Cross-track error
+    artists["error"], = ax_err.plot([], [], "g-", linewidth=1.2, rasterized=True)
+    artists["error_fill"] = None
+    ax_err.set_title("Cross-Track Error to Intended Path")
+    ax_err.set_xlabel("Sample Number")
+    ax_err.set_ylabel("Error (mm)")
+    ax_err.grid(True, alpha=0.3)
+
+    # Place stats on the cross-track axis
+    artists["stats"] = ax_err.text(
+        0.02,
+        0.98,
+        "",
+        transform=ax_err.transAxes,
+        fontsize=10,
+        va="top",
+        bbox=dict(boxstyle="round", facecolor="wheat", alpha=0.8),
+    )
+
+    _figure_artists[name] = artists
+    return artists
+
+
+def plot_path_analysis(intended_waypoints_mm, telemetry: Telemetry,
+                       save_figure: bool = False) -> None:
+
+    headless = _headless(save_figure)
+
+    # Directly trust telemetry.to_arrays() (no try/except / empty checks)
+    _, positions_mm, _, _ = telemetry.to_arrays()
+
+    intended = np.asarray(intended_waypoints_mm, dtype=float)
+    actual = np.asarray(positions_mm, dtype=float)
+
+    
+
+    # Determine dimensionality (2 or 3). If telemetry provides only 1D, we'll treat as 2D with zeros.
+    n_axes = actual.shape[1] if actual.ndim == 2 else 1
+
+    # Cross-track error (mm) to intended polyline (works for 2D or 3D)
+    errors_mm = _project_distance_to_polyline(actual, intended)
+    sample_indices = np.arange(len(errors_mm))
+
+    # Reuse the figure of an earlier call with the same layout, otherwise build it
+    name = "path_analysis_2d" if n_axes == 2 else "path_analysis_3d"
+    artists = _reusable_artists(name)
+    if artists is None:
+        artists = _create_path_figure(name, n_axes, plot_intended_xy=n_axes != 2 or intended.shape[1] >= 2)
+    fig = artists["fig"]
+
+    # Only the plotted path is decimated, the error stats use every sample
+    actual_vis = _visual_decimate(actual)
+    path_segments = {"xy_paths": [actual_vis[:, [0, 1]]]}
+    if len(artists["xy_paths"].get_segments()) == 2:
+        path_segments["xy_paths"].append(intended[:, [0, 1]])
+    if "xz_paths" in artists:
+        path_segments["xz_paths"] = [actual_vis[:, [0, 2]], intended[:, [0, 2]]]
+    for key, segments in path_segments.items():
+        artists[key].set_segments(segments)
+    if "3d_paths" in artists:
+        artists["3d_paths"].set_segments([intended[:, :3], actual_vis[:, :3]])
+        both = np.concatenate([intended[:, :3], actual[:, :3]])
+        artists["3d_paths"].axes.auto_scale_xyz(both[:, 0], both[:, 1], both[:, 2], had_data=False)
+
+    artists["error"].set_data(sample_indices, errors_mm)
+    ax_err = artists["error"].axes
+    if artists["error_fill"] is not None:
+        artists["error_fill"].remove()
+    artists["error_fill"] = ax_err.fill_between(sample_indices, errors_mm, color="C0", alpha=0.2, rasterized=True)
+
+    # relim only covers lines, the path collections are added to the data limits explicitly.
+    # 3D axes are scaled from the data above, relim ignores collections.
+    axes_2d = [ax for ax in fig.axes if ax.name != "3d"]
+    for ax in axes_2d:
+        ax.relim()
+    for key, segments in path_segments.items():
+        artists[key].axes.update_datalim(np.concatenate(segments))
+    for ax in axes_2d:
+        ax.autoscale_view()
     
-    avg_err = float(np.mean(errors_mm))
-    max_err = float(np.max(errors_mm))
-    rms_err = float(np.sqrt(np.mean(errors_mm ** 2)))
+    # Sum of squares with a dot product, no errors_mm ** 2 temporary
+    n_errors = len(errors_mm)
+    avg_err = float(errors_mm.sum()) / n_errors
+    max_err = float(errors_mm.max())
+    rms_err = float(np.sqrt(np.dot(errors_mm, errors_mm) / n_errors))
 
     stats_text = (
         f"Avg Error: {avg_err:.2f} mm\n"
@@ -138,40 +383,17 @@ def plot_path_analysis(intended_waypoints_mm, telemetry: Telemetry,
         f"RMS Error: {rms_err:.2f} mm\n"
         f"Samples: {len(errors_mm)}"
     )
+    artists["stats"].set_text(stats_text)
 
-    # Place stats on whatever axes exist: prefer cross-track axis if present
-    try:
-        if n_axes == 2:
-            ax2.text(
-                0.02,
-                0.98,
-                stats_text,
-                transform=ax2.transAxes,
-                fontsize=10,
-                va="top",
-                bbox=dict(boxstyle="round", facecolor="wheat", alpha=0.8),
-            )
-        else:
-            ax4.text(
-                0.02,
-                0.98,
-                stats_text,
-                transform=ax4.transAxes,
-                fontsize=10,
-                va="top",
-                bbox=dict(boxstyle="round", facecolor="wheat", alpha=0.8),
-            )
-    except Exception:
-        # If axes not found, silently continue
-        pass
-
-    plt.tight_layout(rect=[0, 0, 1, 0.92])
+    fig.tight_layout(rect=[0, 0, 1, 0.92])
+    fig.canvas.draw_idle()
 
     if save_figure:
-        plt.savefig("path_analysis_cross_track.png", dpi=300, bbox_inches="tight")
+        fig.savefig("path_analysis_cross_track.png", dpi=300, bbox_inches="tight")
         print("Figure saved as: path_analysis_cross_track.png")
 
-    plt.show()
+    if not headless:
+        plt.show()
 
     
 
@@ -180,30 +402,25 @@ def plot_path_analysis(intended_waypoints_mm, telemetry: Telemetry,
 # Velocity analysis
 # ---------------------------------------------------------------------------
 
-def plot_velocity_analysis(telemetry: Telemetry, save_figure: bool = False) -> None:
-   
-    # Again: trust telemetry.to_arrays(); no try/except or empty checks
-    t, _, next_velocity_ms, actual_velocities_ms = telemetry.to_arrays()
-
-    commanded = np.asarray(next_velocity_ms)
-    actual = np.asarray(actual_velocities_ms)
-
-    # Determine number of axes (drives)
-    n_axes = actual.shape[1] if (hasattr(actual, "ndim") and actual.ndim == 2) else 1
-
+def _create_velocity_figure(name: str, n_axes: int) -> dict:
+    _apply_style()
     base_labels = ["X (Drive 1)", "Y (Drive 2)", "Z (Drive 3)"]
     axis_labels = base_labels[:n_axes]
 
-    fig, axes = plt.subplots(n_axes, 1, figsize=(12, 3 * max(1, n_axes)), sharex=True)
+    fig = plt.figure(name, figsize=(12, 3 * max(1, n_axes)))
+    axes = fig.subplots(n_axes, 1, sharex=True)
     fig.suptitle("Velocity Analysis Dashboard", fontsize=16, fontweight="bold")
 
     # Normalize axes to iterable list
     if n_axes == 1:
         axes = [axes]
 
+    artists = {"fig": fig, "actual": [], "commanded": []}
     for i, ax in enumerate(axes):
-        ax.plot(t, actual[:, i], label="Actual Velocity (m/s)", linewidth=1.5)
-        ax.plot(t, commanded[:, i], label="Commanded Velocity (m/s)", linestyle="--", linewidth=1.0)
+        actual_line, = ax.plot([], [], label="Actual Velocity (m/s)", linewidth=1.5)
+        commanded_line, = ax.plot([], [], label="Commanded Velocity (m/s)", linestyle="--", linewidth=1.0)
+        artists["actual"].append(actual_line)
+        artists["commanded"].append(commanded_line)
         ax.set_ylabel(f"{axis_labels[i]}\nVel (m/s)")
         ax.set_title(f"{axis_labels[i]} Velocity Tracking", fontsize=12, fontweight="bold")
         ax.grid(True, alpha=0.3)
@@ -212,11 +429,47 @@ def plot_velocity_analysis(telemetry: Telemetry, save_figure: bool = False) -> N
 
     axes[-1].set_xlabel("Time (s)")
 
+    _figure_artists[name] = artists
+    return artists
+
+
+def plot_velocity_analysis(telemetry: Telemetry, save_figure: bool = False) -> None:
+
+    headless = _headless(save_figure)
+
+    # Again: trust telemetry.to_arrays(); no try/except or empty checks
+    t, _, next_velocity_ms, actual_velocities_ms = telemetry.to_arrays()
+
+    commanded = np.asarray(next_velocity_ms)
+    actual = np.asarray(actual_velocities_ms)
+
+    # Determine number of axes (drives)
+    n_axes = actual.shape[1] if (hasattr(actual, "ndim") and actual.ndim == 2) else 1
+
+    # Reuse the figure of an earlier call with the same number of axes, otherwise build it
+    name = f"velocity_analysis_{n_axes}"
+    artists = _reusable_artists(name)
+    if artists is None:
+        artists = _create_velocity_figure(name, n_axes)
+    fig = artists["fig"]
+
+    # Contiguous rows per drive (SoA) instead of strided column views
+    actual_T = np.ascontiguousarray(actual.T)
+    commanded_T = np.ascontiguousarray(commanded.T)
+    for i in range(n_axes):
+        artists["actual"][i].set_data(t, actual_T[i])
+        artists["commanded"][i].set_data(t, commanded_T[i])
+    for ax in fig.axes:
+        ax.relim()
+        ax.autoscale_view()
+    fig.canvas.draw_idle()
+
     if save_figure:
-        plt.savefig("velocity_analysis.png", dpi=300, bbox_inches="tight")
+        fig.savefig("velocity_analysis.png", dpi=300, bbox_inches="tight")
         print("Velocity analysis saved as: velocity_analysis.png")
 
-    plt.show()
+    if not headless:
+        plt.show()
 
 
 # ---------------------------------------------------------------------------